@@ -1,4 +1,11 @@
+import math
+import os
 import sys
+import time
+
+# Taken before the Qt imports so the startup measurement covers them too.
+_STARTUP_T0 = time.perf_counter()
+
 import psutil
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -7,10 +14,32 @@ from PyQt5.QtWidgets import (
     QGraphicsDropShadowEffect, QTabWidget
 )
 from PyQt5.QtCore import (
-    QTimer, Qt, QSortFilterProxyModel, QAbstractTableModel, QModelIndex
+    QTimer, Qt, QSortFilterProxyModel, QAbstractTableModel, QModelIndex,
+    QEvent, QItemSelectionModel
 )
 from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
-import pyqtgraph as pg
+
+# pyqtgraph is only needed by the Performance charts, so it is imported on the
+# first chart build (see loadPyqtgraph) instead of on the cold-start path.
+pg = None
+
+# Target time (ms) from launch to the first interactive frame. Exceeding it is
+# reported on stderr; set PROCSIGHT_TRACE_STARTUP=1 to always report it.
+STARTUP_BUDGET_MS = 1000
+
+# Number of processes added to the table per event-loop turn on the first scan.
+INITIAL_SCAN_BATCH = 64
+
+
+def loadPyqtgraph():
+    """Import pyqtgraph and apply the dark chart theme on first use."""
+    global pg
+    if pg is None:
+        import pyqtgraph
+        pyqtgraph.setConfigOption("background", "#262626")
+        pyqtgraph.setConfigOption("foreground", "#E0E0E0")
+        pg = pyqtgraph
+    return pg
 
 ##############################################################################
 # 1. Custom Process Table Model
@@ -50,8 +79,379 @@ class ProcessTableModel(QAbstractTableModel):
         self.processes = processes
         self.endResetModel()
 
+    def appendProcesses(self, processes):
+        if not processes:
+            return
+        first = len(self.processes)
+        self.beginInsertRows(QModelIndex(), first, first + len(processes) - 1)
+        self.processes.extend(processes)
+        self.endInsertRows()
+
+##############################################################################
+# 1.1. Cgroup (v2) Resource Accounting
+##############################################################################
+# Controllers the Containers page reads from (cpu.*, memory.*, io.*)
+CGROUP_CONTROLLERS = ("cpu", "memory", "io")
+
+# Containers page chart title while no cgroup is selected
+CGROUP_CHART_PROMPT = "Select a cgroup to chart its history"
+
+
+def findCgroup2Root():
+    """Return the cgroup v2 mount point, or None if the host has none."""
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
+    roots = [fields[1] for fields in mounts
+             if len(fields) > 2 and fields[2] == "cgroup2"]
+    if "/sys/fs/cgroup" in roots:
+        return "/sys/fs/cgroup"
+    return roots[0] if roots else None
+
+
+def readProcCgroup(pid):
+    """Return the cgroup v2 path of a process (e.g. "/system.slice/x.service")."""
+    try:
+        with open(f"/proc/{pid}/cgroup") as f:
+            for line in f:
+                if line.startswith("0::"):
+                    return line[3:].strip()
+    except OSError:
+        pass
+    return None
+
+
+def cgroupAncestors(path):
+    """Yield a cgroup path followed by each of its parents up to "/"."""
+    while True:
+        yield path
+        if path == "/":
+            return
+        path = path.rsplit("/", 1)[0] or "/"
+
+
+def readCgroupValue(path):
+    """
+    Read a single-value cgroup file. "max" gives math.inf; missing or
+    unparsable files give None.
+    """
+    try:
+        with open(path) as f:
+            value = f.read().strip()
+        return math.inf if value == "max" else int(value)
+    except (OSError, ValueError):
+        return None
+
+
+def readCgroupKeyed(path):
+    """Read a flat "key value" cgroup file such as cpu.stat."""
+    values = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                key, _, value = line.partition(" ")
+                values[key] = int(value)
+    except (OSError, ValueError):
+        pass
+    return values
+
+
+def readCgroupCpuLimit(path):
+    """Return the cpu.max quota in CPUs (math.inf if unlimited), or None."""
+    try:
+        with open(path) as f:
+            quota, period = f.read().split()
+        return math.inf if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError, ZeroDivisionError):
+        return None
+
+
+def readCgroupIo(path):
+    """Return (read bytes, write bytes) summed over all devices in io.stat."""
+    rbytes = wbytes = 0
+    try:
+        with open(path) as f:
+            for line in f:
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "rbytes":
+                        rbytes += int(value)
+                    elif key == "wbytes":
+                        wbytes += int(value)
+    except (OSError, ValueError):
+        return None
+    return rbytes, wbytes
+
+
+def limitPercent(used, limit):
+    """Usage as a percentage of a finite limit, or None."""
+    if used is None or limit is None or limit == math.inf or not limit:
+        return None
+    return used / limit * 100
+
+
+class CgroupStats:
+    """Latest readings and history for one cgroup."""
+
+    def __init__(self, path):
+        self.path = path
+        self.procCount = 0  # processes in this cgroup and its descendants
+
+        self.cpuPercent = None
+        self.cpuLimit = None
+        self.throttled = None
+        self.memory = None
+        self.memoryLimit = None
+        self.ioRead = None
+        self.ioWrite = None
+
+        # History for the charts (same length, one point per sample)
+        self.cpuData = []
+        self.memData = []
+        self.ioReadData = []
+        self.ioWriteData = []
+
+        self.lastTime = None
+        self.lastUsage = None
+        self.lastThrottled = None
+        self.lastIo = None
+
+    def depth(self):
+        return 0 if self.path == "/" else self.path.count("/")
+
+    def name(self):
+        return self.path.rsplit("/", 1)[1] or "/"
+
+    def update(self, directory, maxDataPoints):
+        now = time.monotonic()
+        elapsed = now - self.lastTime if self.lastTime is not None else None
+        self.lastTime = now
+
+        cpuStat = readCgroupKeyed(os.path.join(directory, "cpu.stat"))
+        usage = cpuStat.get("usage_usec")
+        throttled = cpuStat.get("nr_throttled")
+        io = readCgroupIo(os.path.join(directory, "io.stat"))
+
+        self.cpuLimit = readCgroupCpuLimit(os.path.join(directory, "cpu.max"))
+        self.memory = readCgroupValue(os.path.join(directory, "memory.current"))
+        self.memoryLimit = readCgroupValue(os.path.join(directory, "memory.max"))
+
+        if elapsed:
+            if usage is not None and self.lastUsage is not None:
+                # usage_usec over elapsed seconds; 100% is one full CPU
+                self.cpuPercent = max(0, usage - self.lastUsage) / (elapsed * 1e4)
+            if throttled is not None and self.lastThrottled is not None:
+                self.throttled = max(0, throttled - self.lastThrottled)
+            if io is not None and self.lastIo is not None:
+                self.ioRead = max(0, io[0] - self.lastIo[0]) / 1024.0 / elapsed
+                self.ioWrite = max(0, io[1] - self.lastIo[1]) / 1024.0 / elapsed
+
+            for data, value in ((self.cpuData, self.cpuPercent),
+                                (self.memData, (self.memory or 0) / 1_048_576),
+                                (self.ioReadData, self.ioRead),
+                                (self.ioWriteData, self.ioWrite)):
+                data.append(value or 0.0)
+                if len(data) > maxDataPoints:
+                    data.pop(0)
+
+        self.lastUsage = usage
+        self.lastThrottled = throttled
+        self.lastIo = io
+
+
+class CgroupMonitor:
+    """
+    Groups processes by their cgroup (v2) and reads each cgroup's cpu.stat,
+    memory.current and io.stat directly, so a sample costs a few file reads
+    per cgroup instead of a sum over every process. Every ancestor of an
+    occupied cgroup is sampled too, since slices are where quotas usually live.
+    """
+
+    # Samples between full re-reads of the PID -> cgroup map, to pick up
+    # processes that moved cgroup or PIDs that were reused
+    remapInterval = 30
+
+    def __init__(self, maxDataPoints=60):
+        self.root = findCgroup2Root()
+        self.missingControllers = self.findMissingControllers()
+        self.maxDataPoints = maxDataPoints
+        self.pidCgroups = {}
+        self.groups = {}
+        self.samplesSinceRemap = 0
+
+    def findMissingControllers(self):
+        if self.root is None:
+            return list(CGROUP_CONTROLLERS)
+        try:
+            with open(os.path.join(self.root, "cgroup.controllers")) as f:
+                enabled = f.read().split()
+        except OSError:
+            enabled = []
+        return [name for name in CGROUP_CONTROLLERS if name not in enabled]
+
+    def available(self):
+        return self.root is not None and not self.missingControllers
+
+    def unavailableReason(self):
+        if self.root is None:
+            return "cgroup v2 is not available on this system."
+        return (f"The cgroup v2 hierarchy at {self.root} has no "
+                f"{', '.join(self.missingControllers)} controller(s) attached.\n"
+                "This is usually a hybrid v1/v2 host, where resource controllers "
+                "stay on the v1 hierarchies.\nBoot with "
+                "systemd.unified_cgroup_hierarchy=1 to use this view.")
+
+    def sample(self):
+        self.samplesSinceRemap += 1
+        if self.samplesSinceRemap >= self.remapInterval:
+            self.pidCgroups = {}
+            self.samplesSinceRemap = 0
+
+        # Only PIDs not seen before need their cgroup looked up. Unreadable
+        # ones are cached as None and retried at the next remap.
+        pids = set(psutil.pids())
+        for pid in self.pidCgroups.keys() - pids:
+            del self.pidCgroups[pid]
+        for pid in pids - self.pidCgroups.keys():
+            self.pidCgroups[pid] = readProcCgroup(pid)
+
+        # Count each process against its cgroup and every ancestor
+        counts = {}
+        for leaf in self.pidCgroups.values():
+            if leaf is None:
+                continue
+            for path in cgroupAncestors(leaf):
+                counts[path] = counts.get(path, 0) + 1
+
+        for path in self.groups.keys() - counts.keys():
+            del self.groups[path]
+        for path, count in counts.items():
+            stats = self.groups.get(path)
+            if stats is None:
+                stats = self.groups[path] = CgroupStats(path)
+            stats.procCount = count
+            stats.update(os.path.join(self.root, path.lstrip("/")),
+                         self.maxDataPoints)
+
+
+class CgroupTableModel(QAbstractTableModel):
+    """
+    Table of CgroupStats. Qt.UserRole holds the numeric sort key of each
+    cell; the Cgroup column sorts into tree order.
+    """
+
+    def __init__(self, groups=None):
+        super().__init__()
+        self.header = ["Cgroup", "Procs", "CPU %", "CPU Limit", "Throttled",
+                       "Memory", "Memory Limit", "IO Read KB/s", "IO Write KB/s"]
+        self.groups = groups or []
+
+    def data(self, index, role):
+        if not index.isValid():
+            return None
+        stats, col = self.groups[index.row()], index.column()
+        if role == Qt.DisplayRole:
+            return self.displayText(stats, col)
+        elif role == Qt.UserRole:
+            return self.sortKey(stats, col)
+        elif role == Qt.ToolTipRole and col == 0:
+            return stats.path
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignLeft | Qt.AlignVCenter if col == 0 else Qt.AlignCenter
+        return None
+
+    def rowCount(self, parent=None):
+        return len(self.groups)
+
+    def columnCount(self, parent=None):
+        return len(self.header)
+
+    def headerData(self, section, orientation, role):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self.header[section]
+            else:
+                return section
+        return None
+
+    def updateGroups(self, groups):
+        """
+        Show the given groups. Returns True if the model had to be reset
+        (groups added or removed), False if rows were refreshed in place.
+        """
+        if [g.path for g in groups] == [g.path for g in self.groups]:
+            self.groups = groups
+            if groups:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(groups) - 1, len(self.header) - 1))
+            return False
+        self.beginResetModel()
+        self.groups = groups
+        self.endResetModel()
+        return True
+
+    def displayText(self, stats, col):
+        def mb(value):
+            return f"{value / 1_048_576:.1f} MB"
+
+        def cpus(value):
+            return f"{value:.2f} CPUs"
+
+        def number(value):
+            return f"{value:.1f}" if value is not None else "N/A"
+
+        def limitText(limit, used, fmt):
+            if limit is None:
+                return "N/A"
+            if limit == math.inf:
+                return "max"
+            percent = limitPercent(used, limit)
+            if percent is None:
+                return fmt(limit)
+            return f"{fmt(limit)} ({percent:.0f}%)"
+
+        cpuUsed = stats.cpuPercent / 100 if stats.cpuPercent is not None else None
+        if col == 0:
+            return "    " * stats.depth() + stats.name()
+        elif col == 1:
+            return str(stats.procCount)
+        elif col == 2:
+            return number(stats.cpuPercent)
+        elif col == 3:
+            return limitText(stats.cpuLimit, cpuUsed, cpus)
+        elif col == 4:
+            return str(stats.throttled) if stats.throttled is not None else "N/A"
+        elif col == 5:
+            return mb(stats.memory) if stats.memory is not None else "N/A"
+        elif col == 6:
+            return limitText(stats.memoryLimit, stats.memory, mb)
+        elif col == 7:
+            return number(stats.ioRead)
+        return number(stats.ioWrite)
+
+    def sortKey(self, stats, col):
+        if col == 0:
+            # "/" -> "\x01" keeps children directly after their parent
+            return stats.path.replace("/", "\x01")
+        cpuUsed = stats.cpuPercent / 100 if stats.cpuPercent is not None else None
+        value = (
+            stats.procCount,
+            stats.cpuPercent,
+            limitPercent(cpuUsed, stats.cpuLimit),
+            stats.throttled,
+            stats.memory,
+            limitPercent(stats.memory, stats.memoryLimit),
+            stats.ioRead,
+            stats.ioWrite,
+        )[col - 1]
+        # Missing readings sort below every real value
+        return float(value) if value is not None else -1.0
+
 ##############################################################################
-# 2. Main Application Window (Processes + Performance Only)
+# 2. Main Application Window (Processes + Performance + Containers)
 ##############################################################################
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -65,37 +465,67 @@ class MainWindow(QMainWindow):
         # Apply additional style sheet for custom theming
         self.setStyleSheet(self.modernStyleSheet())
 
+        # For performance deltas
+        self.lastNet = psutil.net_io_counters()
+        self.lastDisk = psutil.disk_io_counters()
+        self.lastMem = None
+        self.cpuFreq = None
+        self.diskCapacity = None
+
+        # We'll store up to 60 data points (1 minute at 1-second intervals)
+        self.maxDataPoints = 60
+
+        # CPU
+        self.cpuData = []
+        # Memory
+        self.memData = []
+        # Disk
+        self.diskReadData = []
+        self.diskWriteData = []
+        # Network
+        self.netUpData = []
+        self.netDownData = []
+        # GPU (placeholder)
+        self.gpuData = []
+        # Cgroups; the monitor is created when the Containers page is first shown
+        self.cgroupMonitor = None
+        self.selectedCgroup = None
+
         # Main container layout
         main_widget = QWidget()
         main_layout = QHBoxLayout(main_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
         self.setCentralWidget(main_widget)
 
-        # Left navigation (sidebar)
+        # Left navigation (sidebar); its drop shadow is applied after the
+        # first frame (see onFirstFrame)
         self.sidebar = QListWidget()
         self.sidebar.setFixedWidth(220)
         self.sidebar.setSpacing(10)
         self.sidebar.setObjectName("Sidebar")
         self.sidebar.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.applyShadow(self.sidebar)
 
         # Example icons (replace with valid file paths or remove if not needed)
         processes_item = QListWidgetItem(" Processes")
         processes_item.setIcon(QIcon("process_icon.png"))
         performance_item = QListWidgetItem(" Performance")
         performance_item.setIcon(QIcon("performance_icon.png"))
+        containers_item = QListWidgetItem(" Containers")
+        containers_item.setIcon(QIcon("containers_icon.png"))
 
-        # Add only these two items
         self.sidebar.addItem(processes_item)
         self.sidebar.addItem(performance_item)
+        self.sidebar.addItem(containers_item)
 
         # Stacked pages on the right
         self.stackedWidget = QStackedWidget()
         self.processesPage = self.createProcessesPage()
-        self.performancePage = self.createPerformancePage()  # Now multi-tab
+        self.performancePage = self.createPerformancePage()  # Tabs built lazily
+        self.cgroupsPage = self.createCgroupsPage()  # Built lazily
 
         self.stackedWidget.addWidget(self.processesPage)
         self.stackedWidget.addWidget(self.performancePage)
+        self.stackedWidget.addWidget(self.cgroupsPage)
 
         # Layout arrangement
         main_layout.addWidget(self.sidebar)
@@ -103,36 +533,18 @@ class MainWindow(QMainWindow):
 
         # Connect sidebar selection
         self.sidebar.currentRowChanged.connect(self.stackedWidget.setCurrentIndex)
+        self.stackedWidget.currentChanged.connect(self.pageChanged)
         self.sidebar.setCurrentRow(0)
 
-        # Timer for real-time updates
+        # Timer for real-time updates; started once the first process scan
+        # has filled the table (see continueInitialProcessScan)
         self.timer = QTimer()
         self.timer.timeout.connect(self.updateAllData)
-        self.timer.start(1000)
-
-        # For performance deltas
-        self.lastNet = psutil.net_io_counters()
-        self.lastDisk = psutil.disk_io_counters()
-
-        # We'll store up to 60 data points (1 minute at 1-second intervals)
-        self.maxDataPoints = 60
+        self.initialScan = None
 
-        # CPU
-        self.cpuData = []
-        # Memory
-        self.memData = []
-        # Disk
-        self.diskReadData = []
-        self.diskWriteData = []
-        # Network
-        self.netUpData = []
-        self.netDownData = []
-        # GPU (placeholder)
-        self.gpuData = []
-
-        # Configure pyqtgraph for a matching dark theme
-        pg.setConfigOption("background", "#262626")
-        pg.setConfigOption("foreground", "#E0E0E0")
+        # Startup work waits for the first real paint (see eventFilter)
+        self.firstFrameShown = False
+        main_widget.installEventFilter(self)
 
     ############################################################################
     # 2.1. Set Fusion Style and Custom Dark Palette
@@ -163,7 +575,61 @@ class MainWindow(QMainWindow):
         widget.setGraphicsEffect(shadow)
 
     ############################################################################
-    # 2.2. Pages: Processes + Performance (Tabbed)
+    # 2.1.1. Startup: First Frame + Progressive Process Scan
+    ############################################################################
+    def eventFilter(self, obj, event):
+        if (not self.firstFrameShown and obj is self.centralWidget()
+                and event.type() == QEvent.Paint):
+            self.firstFrameShown = True
+            obj.removeEventFilter(self)
+            # Queued so it runs once this paint and its flush have completed
+            QTimer.singleShot(0, self.onFirstFrame)
+        return super().eventFilter(obj, event)
+
+    def reportStartupTime(self, elapsed_ms):
+        trace = os.environ.get("PROCSIGHT_TRACE_STARTUP") == "1"
+        if elapsed_ms > STARTUP_BUDGET_MS or trace:
+            print(f"ProcSight: first frame after {elapsed_ms:.0f} ms "
+                  f"(budget {STARTUP_BUDGET_MS} ms)", file=sys.stderr)
+
+    def onFirstFrame(self):
+        elapsed_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+        self.reportStartupTime(elapsed_ms)
+
+        # Deferred cosmetics and the first process snapshot
+        self.applyShadow(self.sidebar)
+        self.startInitialProcessScan()
+
+    def startInitialProcessScan(self):
+        self.initialScan = psutil.process_iter(
+            ['pid', 'name', 'cpu_percent', 'memory_percent'])
+        self.continueInitialProcessScan()
+
+    def continueInitialProcessScan(self):
+        """
+        Add the next batch of processes to the table, then yield to the event
+        loop so the window stays responsive while the first scan completes.
+        """
+        batch = []
+        finished = False
+        while len(batch) < INITIAL_SCAN_BATCH:
+            proc = next(self.initialScan, None)
+            if proc is None:
+                finished = True
+                break
+            row = self.processRow(proc)
+            if row is not None:
+                batch.append(row)
+        self.processModel.appendProcesses(batch)
+
+        if finished:
+            self.initialScan = None
+            self.timer.start(1000)
+        else:
+            QTimer.singleShot(0, self.continueInitialProcessScan)
+
+    ############################################################################
+    # 2.2. Pages: Processes + Performance (Tabbed) + Containers
     ############################################################################
     def createProcessesPage(self):
         page = QWidget()
@@ -203,7 +669,8 @@ class MainWindow(QMainWindow):
     def createPerformancePage(self):
         """
         Create a Performance page with tabs for CPU, Memory, Disk, Network, GPU.
-        Each tab has a PyQtGraph chart + a details panel.
+        Each tab has a PyQtGraph chart + a details panel, built the first time
+        the tab is viewed.
         """
         performanceWidget = QWidget()
         layout = QVBoxLayout(performanceWidget)
@@ -214,27 +681,45 @@ class MainWindow(QMainWindow):
         self.perfTabs.setObjectName("PerfTabs")
         layout.addWidget(self.perfTabs)
 
-        # CPU tab
-        self.cpuTab = self.createCpuTab()
-        self.perfTabs.addTab(self.cpuTab, "CPU")
-
-        # Memory tab
-        self.memoryTab = self.createMemoryTab()
-        self.perfTabs.addTab(self.memoryTab, "Memory")
-
-        # Disk tab
-        self.diskTab = self.createDiskTab()
-        self.perfTabs.addTab(self.diskTab, "Disk")
+        # (title, builder, renderer) per tab; renderers push the collected
+        # history into an already-built tab
+        self.perfTabSpecs = [
+            ("CPU", self.createCpuTab, self.renderCpuTab),
+            ("Memory", self.createMemoryTab, self.renderMemoryTab),
+            ("Disk", self.createDiskTab, self.renderDiskTab),
+            ("Network", self.createNetworkTab, self.renderNetworkTab),
+            ("GPU", self.createGpuTab, self.renderGpuTab),  # placeholder
+        ]
+        self.perfTabsBuilt = set()
+
+        # Empty hosts stand in for each tab until it is first shown
+        for title, _, _ in self.perfTabSpecs:
+            host = QWidget()
+            hostLayout = QVBoxLayout(host)
+            hostLayout.setContentsMargins(0, 0, 0, 0)
+            self.perfTabs.addTab(host, title)
+
+        self.perfTabs.currentChanged.connect(self.showPerfTab)
 
-        # Network tab
-        self.networkTab = self.createNetworkTab()
-        self.perfTabs.addTab(self.networkTab, "Network")
+        return performanceWidget
 
-        # GPU tab (placeholder)
-        self.gpuTab = self.createGpuTab()
-        self.perfTabs.addTab(self.gpuTab, "GPU")
+    def pageChanged(self, index):
+        page = self.stackedWidget.widget(index)
+        if page is self.performancePage:
+            self.showPerfTab(self.perfTabs.currentIndex())
+        elif page is self.cgroupsPage:
+            self.showCgroupsPage()
 
-        return performanceWidget
+    def showPerfTab(self, index):
+        """Build the tab at index on first view and bring it up to date."""
+        if index < 0:
+            return
+        _, build, render = self.perfTabSpecs[index]
+        if index not in self.perfTabsBuilt:
+            loadPyqtgraph()
+            self.perfTabs.widget(index).layout().addWidget(build())
+            self.perfTabsBuilt.add(index)
+        render()
 
     ############################################################################
     # 2.2.1. Individual Resource Tabs (CPU, Memory, Disk, Network, GPU)
@@ -426,115 +911,285 @@ class MainWindow(QMainWindow):
 
         return gpuWidget
 
+    ############################################################################
+    # 2.2.2. Containers Page (cgroup v2 accounting)
+    ############################################################################
+    def createCgroupsPage(self):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(20, 20, 20, 20)
+        return page
+
+    def showCgroupsPage(self):
+        """Build the page and start cgroup sampling the first time it is shown."""
+        if self.cgroupMonitor is None:
+            self.cgroupMonitor = CgroupMonitor(self.maxDataPoints)
+            layout = self.cgroupsPage.layout()
+            if not self.cgroupMonitor.available():
+                notice = QLabel(self.cgroupMonitor.unavailableReason())
+                notice.setAlignment(Qt.AlignCenter)
+                notice.setWordWrap(True)
+                layout.addWidget(notice)
+                return
+            self.buildCgroupsPage(layout)
+            self.cgroupMonitor.sample()
+        if self.cgroupMonitor.available():
+            self.renderCgroups()
+
+    def buildCgroupsPage(self, page_layout):
+        loadPyqtgraph()
+
+        # Cgroup table
+        self.cgroupModel = CgroupTableModel([])
+        self.cgroupProxyModel = QSortFilterProxyModel()
+        self.cgroupProxyModel.setSourceModel(self.cgroupModel)
+        self.cgroupProxyModel.setSortRole(Qt.UserRole)
+
+        self.cgroupView = QTableView()
+        self.cgroupView.setModel(self.cgroupProxyModel)
+        self.cgroupView.setSortingEnabled(True)
+        header = self.cgroupView.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        self.cgroupView.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.cgroupView.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.cgroupView.sortByColumn(0, Qt.AscendingOrder)  # tree order
+        self.cgroupView.selectionModel().currentRowChanged.connect(
+            self.cgroupSelectionChanged)
+        page_layout.addWidget(self.cgroupView, stretch=3)
+
+        # History charts for the selected cgroup
+        self.cgroupChartTitle = QLabel(CGROUP_CHART_PROMPT)
+        page_layout.addWidget(self.cgroupChartTitle)
+
+        charts = QWidget()
+        chartsLayout = QHBoxLayout(charts)
+        chartsLayout.setContentsMargins(0, 0, 0, 0)
+        chartsLayout.setSpacing(20)
+
+        self.cgroupCpuPlot = pg.PlotWidget(title="CPU % (Last 60s)")
+        self.cgroupCpuPlot.showGrid(x=True, y=True, alpha=0.2)
+        self.cgroupCpuPlot.setLabel("left", "Usage (%)")
+        self.cgroupCpuCurve = self.cgroupCpuPlot.plot(
+            pen=pg.mkPen(color="#0078D4", width=2), name="CPU")
+        self.cgroupCpuCurve.setFillLevel(0)
+        self.cgroupCpuCurve.setBrush(pg.mkBrush("#0078D420"))
+        chartsLayout.addWidget(self.cgroupCpuPlot)
+
+        self.cgroupMemPlot = pg.PlotWidget(title="Memory (MB, Last 60s)")
+        self.cgroupMemPlot.showGrid(x=True, y=True, alpha=0.2)
+        self.cgroupMemPlot.setLabel("left", "MB")
+        self.cgroupMemCurve = self.cgroupMemPlot.plot(
+            pen=pg.mkPen(color="#009966", width=2), name="Memory")
+        self.cgroupMemCurve.setFillLevel(0)
+        self.cgroupMemCurve.setBrush(pg.mkBrush("#00996620"))
+        chartsLayout.addWidget(self.cgroupMemPlot)
+
+        self.cgroupIoPlot = pg.PlotWidget(title="IO (KB/s, Last 60s)")
+        self.cgroupIoPlot.showGrid(x=True, y=True, alpha=0.2)
+        self.cgroupIoPlot.setLabel("left", "KB/s")
+        self.cgroupIoReadCurve = self.cgroupIoPlot.plot(
+            pen=pg.mkPen(color="#CC3300", width=2), name="Read")
+        self.cgroupIoWriteCurve = self.cgroupIoPlot.plot(
+            pen=pg.mkPen(color="#00CC99", width=2), name="Write")
+        chartsLayout.addWidget(self.cgroupIoPlot)
+
+        page_layout.addWidget(charts, stretch=2)
+
+    def cgroupSelectionChanged(self, current, previous):
+        # Model resets clear the current index; keep charting the last pick
+        if not current.isValid():
+            return
+        source_index = self.cgroupProxyModel.mapToSource(current)
+        try:
+            self.selectedCgroup = self.cgroupModel.groups[source_index.row()].path
+        except IndexError:
+            return
+        self.renderCgroupCharts()
+
     ############################################################################
     # 2.3. Data Updates (Process Table + Performance)
     ############################################################################
     def updateAllData(self):
         self.updateProcessTable()
         self.updatePerformanceCharts()
+        self.updateCgroups()
+
+    def processRow(self, proc):
+        try:
+            info = proc.info
+            return [
+                str(info['pid']),
+                str(info['name']),
+                f"{info['cpu_percent']:.1f}",
+                f"{info['memory_percent']:.1f}"
+            ]
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
 
     def updateProcessTable(self):
         processes = []
         for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-            try:
-                info = proc.info
-                processes.append([
-                    str(info['pid']),
-                    str(info['name']),
-                    f"{info['cpu_percent']:.1f}",
-                    f"{info['memory_percent']:.1f}"
-                ])
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+            row = self.processRow(proc)
+            if row is not None:
+                processes.append(row)
         self.processModel.updateProcesses(processes)
 
     def updatePerformanceCharts(self):
+        """
+        Sample every resource into its history, then redraw only the tab that
+        is on screen; hidden tabs catch up from the history when shown.
+        """
+        self.samplePerformance()
+        if self.stackedWidget.currentWidget() is self.performancePage:
+            index = self.perfTabs.currentIndex()
+            if index in self.perfTabsBuilt:
+                self.perfTabSpecs[index][2]()
+
+    def appendSample(self, data, value):
+        data.append(value)
+        if len(data) > self.maxDataPoints:
+            data.pop(0)
+
+    def samplePerformance(self):
         # 1) CPU
-        cpu = psutil.cpu_percent()
-        self.cpuData.append(cpu)
-        if len(self.cpuData) > self.maxDataPoints:
-            self.cpuData.pop(0)
+        self.appendSample(self.cpuData, psutil.cpu_percent())
+        self.cpuFreq = psutil.cpu_freq()
+
+        # 2) Memory
+        self.lastMem = psutil.virtual_memory()
+        self.appendSample(self.memData, self.lastMem.percent)
+
+        # 3) Network
+        currentNet = psutil.net_io_counters()
+        self.appendSample(self.netUpData,
+                          (currentNet.bytes_sent - self.lastNet.bytes_sent) / 1024.0)
+        self.appendSample(self.netDownData,
+                          (currentNet.bytes_recv - self.lastNet.bytes_recv) / 1024.0)
+        self.lastNet = currentNet
+
+        # 4) Disk
+        currentDisk = psutil.disk_io_counters()
+        self.appendSample(self.diskReadData,
+                          (currentDisk.read_bytes - self.lastDisk.read_bytes) / 1024.0)
+        self.appendSample(self.diskWriteData,
+                          (currentDisk.write_bytes - self.lastDisk.write_bytes) / 1024.0)
+        self.lastDisk = currentDisk
+
+        # If you want to show capacity for a specific disk (e.g., C: on Windows)
+        try:
+            self.diskCapacity = psutil.disk_usage("C:\\")
+        except Exception:
+            pass
+
+        # 5) GPU (placeholder)
+        dummy_gpu = 5.0  # placeholder usage
+        self.appendSample(self.gpuData, dummy_gpu)
+
+    def renderCpuTab(self):
+        if not self.cpuData:
+            return
         self.cpuCurve.setData(self.cpuData)
-        self.cpuLabel_Usage.setText(f"Usage: {cpu:.1f}%")
+        self.cpuLabel_Usage.setText(f"Usage: {self.cpuData[-1]:.1f}%")
 
         # CPU frequency, cores, threads
-        freq = psutil.cpu_freq()
-        if freq:
-            self.cpuLabel_Speed.setText(f"Speed: {freq.current/1000:.2f} GHz")
+        if self.cpuFreq:
+            self.cpuLabel_Speed.setText(f"Speed: {self.cpuFreq.current/1000:.2f} GHz")
         self.cpuLabel_Cores.setText(f"Cores: {psutil.cpu_count(logical=False)}")
         self.cpuLabel_Threads.setText(f"Threads: {psutil.cpu_count(logical=True)}")
 
-        # 2) Memory
-        mem = psutil.virtual_memory()
-        mem_percent = mem.percent
+    def renderMemoryTab(self):
+        if not self.memData:
+            return
+        mem = self.lastMem
         mem_total_gb = mem.total / (1024**3)
         mem_used_gb = (mem.total - mem.available) / (1024**3)
         mem_avail_gb = mem.available / (1024**3)
 
-        self.memData.append(mem_percent)
-        if len(self.memData) > self.maxDataPoints:
-            self.memData.pop(0)
         self.memCurve.setData(self.memData)
 
-        self.memLabel_Usage.setText(f"Usage: {mem_percent:.1f}%")
+        self.memLabel_Usage.setText(f"Usage: {mem.percent:.1f}%")
         self.memLabel_Total.setText(f"Total: {mem_total_gb:.1f} GB")
         self.memLabel_Available.setText(f"Available: {mem_avail_gb:.1f} GB")
         self.memLabel_Used.setText(f"Used: {mem_used_gb:.1f} GB")
 
-        # 3) Network
-        currentNet = psutil.net_io_counters()
-        upSpeed = (currentNet.bytes_sent - self.lastNet.bytes_sent) / 1024.0
-        downSpeed = (currentNet.bytes_recv - self.lastNet.bytes_recv) / 1024.0
-        self.lastNet = currentNet
-
-        self.netUpData.append(upSpeed)
-        self.netDownData.append(downSpeed)
-        if len(self.netUpData) > self.maxDataPoints:
-            self.netUpData.pop(0)
-        if len(self.netDownData) > self.maxDataPoints:
-            self.netDownData.pop(0)
+    def renderNetworkTab(self):
+        if not self.netUpData:
+            return
         self.netUpCurve.setData(self.netUpData)
         self.netDownCurve.setData(self.netDownData)
 
-        self.netLabel_Up.setText(f"Upload: {upSpeed:.1f} KB/s")
-        self.netLabel_Down.setText(f"Download: {downSpeed:.1f} KB/s")
-        self.netLabel_Sent.setText(f"Total Sent: {currentNet.bytes_sent/1_048_576:.1f} MB")
-        self.netLabel_Recv.setText(f"Total Received: {currentNet.bytes_recv/1_048_576:.1f} MB")
-
-        # 4) Disk
-        currentDisk = psutil.disk_io_counters()
-        readSpeed = (currentDisk.read_bytes - self.lastDisk.read_bytes) / 1024.0
-        writeSpeed = (currentDisk.write_bytes - self.lastDisk.write_bytes) / 1024.0
-        self.lastDisk = currentDisk
+        self.netLabel_Up.setText(f"Upload: {self.netUpData[-1]:.1f} KB/s")
+        self.netLabel_Down.setText(f"Download: {self.netDownData[-1]:.1f} KB/s")
+        self.netLabel_Sent.setText(f"Total Sent: {self.lastNet.bytes_sent/1_048_576:.1f} MB")
+        self.netLabel_Recv.setText(f"Total Received: {self.lastNet.bytes_recv/1_048_576:.1f} MB")
 
-        self.diskReadData.append(readSpeed)
-        self.diskWriteData.append(writeSpeed)
-        if len(self.diskReadData) > self.maxDataPoints:
-            self.diskReadData.pop(0)
-        if len(self.diskWriteData) > self.maxDataPoints:
-            self.diskWriteData.pop(0)
+    def renderDiskTab(self):
+        if not self.diskReadData:
+            return
         self.diskReadCurve.setData(self.diskReadData)
         self.diskWriteCurve.setData(self.diskWriteData)
 
-        self.diskLabel_Read.setText(f"Read: {readSpeed:.1f} KB/s")
-        self.diskLabel_Write.setText(f"Write: {writeSpeed:.1f} KB/s")
+        self.diskLabel_Read.setText(f"Read: {self.diskReadData[-1]:.1f} KB/s")
+        self.diskLabel_Write.setText(f"Write: {self.diskWriteData[-1]:.1f} KB/s")
 
-        # If you want to show capacity for a specific disk (e.g., C: on Windows)
-        try:
-            usage = psutil.disk_usage("C:\\")
-            total_gb = usage.total / (1024**3)
-            used_gb = usage.used / (1024**3)
+        if self.diskCapacity:
+            total_gb = self.diskCapacity.total / (1024**3)
+            used_gb = self.diskCapacity.used / (1024**3)
             self.diskLabel_Capacity.setText(f"Capacity: {used_gb:.1f}/{total_gb:.1f} GB")
-        except Exception:
-            pass
 
-        # 5) GPU (placeholder)
-        dummy_gpu = 5.0  # placeholder usage
-        self.gpuData.append(dummy_gpu)
-        if len(self.gpuData) > self.maxDataPoints:
-            self.gpuData.pop(0)
+    def renderGpuTab(self):
+        if not self.gpuData:
+            return
         self.gpuCurve.setData(self.gpuData)
-        self.gpuLabel_Usage.setText(f"Usage: {dummy_gpu:.1f}%")
+        self.gpuLabel_Usage.setText(f"Usage: {self.gpuData[-1]:.1f}%")
+
+    def updateCgroups(self):
+        # Nothing is collected until the Containers page has been opened
+        if self.cgroupMonitor is None or not self.cgroupMonitor.available():
+            return
+        self.cgroupMonitor.sample()
+        if self.stackedWidget.currentWidget() is self.cgroupsPage:
+            self.renderCgroups()
+
+    def renderCgroups(self):
+        groups = list(self.cgroupMonitor.groups.values())
+        if self.cgroupModel.updateGroups(groups):
+            self.restoreCgroupSelection()
+        self.renderCgroupCharts()
+
+    def restoreCgroupSelection(self):
+        """
+        Re-highlight the selected cgroup after a model reset. select() leaves
+        the current index alone, so the view does not scroll to the row and
+        cgroupSelectionChanged does not fire.
+        """
+        for row, stats in enumerate(self.cgroupModel.groups):
+            if stats.path == self.selectedCgroup:
+                index = self.cgroupProxyModel.mapFromSource(
+                    self.cgroupModel.index(row, 0))
+                self.cgroupView.selectionModel().select(
+                    index,
+                    QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+                break
+
+    def renderCgroupCharts(self):
+        if self.selectedCgroup is None:
+            return
+        stats = self.cgroupMonitor.groups.get(self.selectedCgroup)
+        if stats is None:
+            # The selected cgroup is gone (e.g. a stopped container)
+            self.selectedCgroup = None
+            self.cgroupChartTitle.setText(CGROUP_CHART_PROMPT)
+            for curve in (self.cgroupCpuCurve, self.cgroupMemCurve,
+                          self.cgroupIoReadCurve, self.cgroupIoWriteCurve):
+                curve.setData([])
+            return
+        self.cgroupChartTitle.setText(f"History: {stats.path}")
+        self.cgroupCpuCurve.setData(stats.cpuData)
+        self.cgroupMemCurve.setData(stats.memData)
+        self.cgroupIoReadCurve.setData(stats.ioReadData)
+        self.cgroupIoWriteCurve.setData(stats.ioWriteData)
 
     ############################################################################
     # 2.4. Process Termination (Context Menu)